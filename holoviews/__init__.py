@@ -111,11 +111,12 @@ import warnings
 warnings.filterwarnings("ignore",
                         message="elementwise comparison failed; returning scalar instead")
 
-try:
-    import IPython                 # noqa (API import)
+# Importing IPython is expensive, so the notebook extension is only
+# loaded when IPython has already been imported, e.g. in a kernel.
+if 'IPython' in sys.modules:
     from .ipython import notebook_extension
     extension = notebook_extension # noqa (name remapping)
-except ImportError:
+else:
     class notebook_extension(param.ParameterizedFunction):
         def __call__(self, *args, **opts): # noqa (dummy signature)
             raise Exception("IPython notebook not available: use hv.extension instead.")
@@ -131,22 +132,21 @@ if '_pyodide' in sys.modules:
     del pyodide_extension, in_jupyterlite
 
 # A single holoviews.rc file may be executed if found.
-for rcfile in [os.environ.get("HOLOVIEWSRC", ''),
-               os.path.abspath(os.path.join(os.path.split(__file__)[0],
-                                            '..', 'holoviews.rc')),
-               "~/.holoviews.rc",
-               "~/.config/holoviews/holoviews.rc"]:
-    filename = os.path.expanduser(rcfile)
-    if os.path.isfile(filename):
-        with open(filename, encoding='utf8') as f:
-            code = compile(f.read(), filename, 'exec')
-            try:
-                exec(code)
-            except Exception as e:
-                print(f"Warning: Could not load {filename!r} [{str(e)!r}]")
-        del f, code
-        break
-    del filename
+_rcfiles = (os.path.expanduser(os.environ.get("HOLOVIEWSRC", '')),
+            os.path.abspath(os.path.join(os.path.split(__file__)[0],
+                                         '..', 'holoviews.rc')),
+            os.path.expanduser("~/.holoviews.rc"),
+            os.path.expanduser("~/.config/holoviews/holoviews.rc"))
+rcfile = next((f for f in _rcfiles if f and os.path.isfile(f)), None)
+if rcfile is not None:
+    with open(rcfile, encoding='utf8') as f:
+        code = compile(f.read(), rcfile, 'exec')
+        try:
+            exec(code)
+        except Exception as e:
+            print(f"Warning: Could not load {rcfile!r} [{str(e)!r}]")
+    del f, code
+del _rcfiles
 
 def help(obj, visualization=True, ansi=True, backend=None,
          recursive=False, pattern=None):
@@ -0,0 +1,47 @@
+import os
+import sys
+from subprocess import check_output
+
+
+def _run(code, **env):
+    output = check_output([sys.executable, '-c', code], env=dict(os.environ, **env))
+    return output.decode().strip()
+
+
+def test_no_ipython_import_on_import():
+    check = "import sys; import holoviews; print('IPython' in sys.modules)"
+    assert _run(check) == 'False'
+
+
+def test_star_import_defines_extensions():
+    check = ("import sys; from holoviews import *; "
+             "print('extension' in dir(), 'notebook_extension' in dir(), "
+             "'IPython' in sys.modules)")
+    assert _run(check) == 'True True False'
+
+
+def test_extension_without_ipython_imported():
+    check = ("import holoviews as hv; from holoviews.util import extension; "
+             "print(hv.extension is extension)")
+    assert _run(check) == 'True'
+
+
+def test_notebook_extension_with_ipython_imported():
+    check = ("import IPython; import holoviews as hv; "
+             "from holoviews.ipython import notebook_extension; "
+             "print(hv.extension is notebook_extension, "
+             "hv.notebook_extension is notebook_extension)")
+    assert _run(check) == 'True True'
+
+
+def test_extension_subclass():
+    check = ("import holoviews as hv\n"
+             "class custom_extension(hv.extension): pass\n"
+             "print(issubclass(custom_extension, hv.extension))")
+    assert _run(check) == 'True'
+
+
+def test_extension_available_in_rcfile(tmp_path):
+    rcfile = tmp_path / 'holoviews.rc'
+    rcfile.write_text("print(extension.__name__)")
+    assert _run('import holoviews', HOLOVIEWSRC=str(rcfile)) == 'extension'
@@ -3,7 +3,7 @@ Unit tests of the helper functions in utils
 """
 from collections import OrderedDict
 
-from holoviews import notebook_extension
+from holoviews.ipython import notebook_extension
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews import Store
 from holoviews.util import output, opts, OutputSettings, Options
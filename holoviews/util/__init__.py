@@ -17,6 +17,7 @@ from ..core import (
     StoreOptions, Store
 )
 from ..core.options import Keywords, Options, options_policy
+from ..core.pprint import InfoPrinter
 from ..core.operation import Operation
 from ..core.overlay import Overlay
 from ..core.util import merge_options_to_dict, OrderedDict
@@ -27,6 +28,7 @@ from ..streams import Stream, Params, streams_list_from_dict
 from .settings import OutputSettings, list_formats, list_backends
 
 Store.output_settings = OutputSettings
+InfoPrinter.store = Store
 
 
 